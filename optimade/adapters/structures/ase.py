@@ -7,28 +7,28 @@ This conversion function relies on the ASE code.
 
 For more information on the ASE code see [their documentation](https://wiki.fysik.dtu.dk/ase/).
 """
-from typing import Dict
+from warnings import warn
 
-from optimade.models import Species as OptimadeStructureSpecies
 from optimade.models import StructureResource as OptimadeStructure
 from optimade.models import StructureFeatures
 
 from optimade.adapters.exceptions import ConversionError
+from optimade.adapters.warnings import AdapterPackageNotFound
+from optimade.adapters.structures.utils import species_from_species_at_sites
 
-try:
-    from ase import Atoms, Atom
-except (ImportError, ModuleNotFoundError):
-    from warnings import warn
-    from optimade.adapters.warnings import AdapterPackageNotFound
+Atoms = None
+"""The ASE `Atoms` class, imported (and cached here) upon first use.
 
-    Atoms = type("Atoms", (), {})
-    ASE_NOT_FOUND = "ASE not found, cannot convert structure to an ASE Atoms"
+Set to `False` if ASE cannot be imported, so the import is only ever attempted once.
+"""
+
+ASE_NOT_FOUND = "ASE not found, cannot convert structure to an ASE Atoms"
 
 
 __all__ = ("get_ase_atoms",)
 
 
-def get_ase_atoms(optimade_structure: OptimadeStructure) -> Atoms:
+def get_ase_atoms(optimade_structure: OptimadeStructure) -> "Atoms":
     """Get ASE `Atoms` from OPTIMADE structure.
 
     Caution:
@@ -41,7 +41,16 @@ def get_ase_atoms(optimade_structure: OptimadeStructure) -> Atoms:
         ASE `Atoms` object.
 
     """
-    if "optimade.adapters" in repr(globals().get("Atoms")):
+    # Import ASE lazily; it is a large package that should not burden
+    # consumers who never convert to this format.
+    global Atoms
+    if Atoms is None:
+        try:
+            from ase import Atoms
+        except (ImportError, ModuleNotFoundError):
+            Atoms = False
+
+    if not Atoms:
         warn(ASE_NOT_FOUND, AdapterPackageNotFound)
         return None
 
@@ -53,31 +62,28 @@ def get_ase_atoms(optimade_structure: OptimadeStructure) -> Atoms:
             "ASE cannot handle structures with partial occupancies, sorry."
         )
 
-    species: Dict[str, OptimadeStructureSpecies] = {
-        species.name: species for species in attributes.species
-    }
-
     # Since we've made sure there are no species with more than 1 chemical symbol,
     # asking for index 0 will always work.
-    if "X" in [specie.chemical_symbols[0] for specie in species.values()]:
+    if "X" in [specie.chemical_symbols[0] for specie in attributes.species]:
         raise ConversionError(
             "ASE cannot handle structures with unknown ('X') chemical symbols, sorry."
         )
 
-    atoms = []
-    for site_number in range(attributes.nsites):
-        species_name = attributes.species_at_sites[site_number]
-        site = attributes.cartesian_site_positions[site_number]
-
-        current_species = species[species_name]
-
-        # Argument above about chemical symbols also holds here
-        mass = None
-        if current_species.mass:
-            mass = current_species.mass[0]
+    species_per_site = species_from_species_at_sites(
+        attributes.species_at_sites, attributes.species
+    )
 
-        atoms.append(Atom(symbol=species_name, position=site, mass=mass))
+    # Argument above about chemical symbols also holds here.
+    # Note: ASE substitutes the standard atomic mass for any site where the mass is `None`.
+    masses = [
+        current_species.mass[0] if current_species.mass else None
+        for current_species in species_per_site
+    ]
 
     return Atoms(
-        symbols=atoms, cell=attributes.lattice_vectors, pbc=attributes.dimension_types
+        symbols=attributes.species_at_sites,
+        positions=attributes.cartesian_site_positions,
+        masses=masses,
+        cell=attributes.lattice_vectors,
+        pbc=attributes.dimension_types,
     )
@@ -16,9 +16,8 @@ Note:
 
 This conversion function relies on the [NumPy](https://numpy.org/) library.
 """
-from typing import Dict
+from typing import Dict, List, Tuple
 
-from optimade.models import Species as OptimadeStructureSpecies
 from optimade.models import StructureResource as OptimadeStructure
 
 from optimade.adapters.structures.utils import (
@@ -36,10 +35,18 @@ except ImportError:
     NUMPY_NOT_FOUND = "NumPy not found, cannot convert structure to CIF"
 
 
-__all__ = ("get_cif",)
+__all__ = ("get_cif", "get_cif_bytes")
 
 
-def get_cif(  # pylint: disable=too-many-locals,too-many-branches
+_ATOM_SITE_ROW_FMT = "  %s %s %6.4f %s  %s  %s  Biso  1.000 \n"
+"""`%`-style format for a single atom site row.
+
+The thermal displacement type and B_iso values are fixed to `Biso` and `1.000`
+(the latter padded to its previous six-character field width).
+"""
+
+
+def get_cif(
     optimade_structure: OptimadeStructure,
 ) -> str:
     """Get CIF file as string from OPTIMADE structure.
@@ -56,34 +63,77 @@ def get_cif(  # pylint: disable=too-many-locals,too-many-branches
         warn(NUMPY_NOT_FOUND, AdapterPackageNotFound)
         return None
 
-    cif = """#
+    return "".join(_get_cif_parts(optimade_structure))
+
+
+def get_cif_bytes(
+    optimade_structure: OptimadeStructure,
+) -> bytes:
+    """Get CIF file as latin-1 encoded bytes from OPTIMADE structure.
+
+    Each part of the file is encoded as it is emitted, avoiding the
+    intermediate full-size `str` object that `get_cif` followed by
+    `str.encode()` would produce.
+
+    Parameters:
+        optimade_structure: OPTIMADE structure.
+
+    Returns:
+        The CIF file as a single Python `bytes` object, encoded with latin-1.
+
+    """
+    # NumPy is needed for calculations
+    if globals().get("np", None) is None:
+        warn(NUMPY_NOT_FOUND, AdapterPackageNotFound)
+        return None
+
+    return b"".join(
+        part.encode("latin-1") for part in _get_cif_parts(optimade_structure)
+    )
+
+
+def _get_cif_parts(  # pylint: disable=too-many-locals,too-many-branches
+    optimade_structure: OptimadeStructure,
+) -> List[str]:
+    """Assemble the CIF file as a list of string parts.
+
+    Parameters:
+        optimade_structure: OPTIMADE structure.
+
+    Returns:
+        The parts of the CIF file, to be joined (and possibly encoded) by the caller.
+
+    """
+    # Collect the file in a list of parts and join them once at the very end;
+    # repeated `str` concatenation would copy the accumulated file every time
+    cif = [
+        """#
 # Created from an OPTIMADE structure.
 #
 # See https://www.optimade.org and/or
 # https://github.com/Materials-Consortia/OPTIMADE for more information.
 #
-"""
-
-    cif += f"data_{optimade_structure.id}\n\n"
+""",
+        f"data_{optimade_structure.id}\n\n",
+    ]
 
     attributes = optimade_structure.attributes
 
     # Do this only if there's three non-zero lattice vectors
     # NOTE: This also negates handling of lattice_vectors with null/None values
     if all(attributes.dimension_types):
-        a_vector, b_vector, c_vector, alpha, beta, gamma = cell_to_cellpar(
-            attributes.lattice_vectors
-        )
-
-        cif += (
-            f"_cell_length_a                    {a_vector:g}\n"
-            f"_cell_length_b                    {b_vector:g}\n"
-            f"_cell_length_c                    {c_vector:g}\n"
-            f"_cell_angle_alpha                 {alpha:g}\n"
-            f"_cell_angle_beta                  {beta:g}\n"
-            f"_cell_angle_gamma                 {gamma:g}\n\n"
+        cif.append(
+            (
+                "_cell_length_a                    %g\n"
+                "_cell_length_b                    %g\n"
+                "_cell_length_c                    %g\n"
+                "_cell_angle_alpha                 %g\n"
+                "_cell_angle_beta                  %g\n"
+                "_cell_angle_gamma                 %g\n\n"
+            )
+            % tuple(cell_to_cellpar(attributes.lattice_vectors))
         )
-        cif += (
+        cif.append(
             "_symmetry_space_group_name_H-M    'P 1'\n"
             "_symmetry_int_tables_number       1\n\n"
             "loop_\n"
@@ -105,7 +155,7 @@ def get_cif(  # pylint: disable=too-many-locals,too-many-branches
         "fract" if hasattr(attributes, "fractional_site_positions") else "Cartn"
     )
 
-    cif += (
+    cif.append(
         "loop_\n"
         "  _atom_site_type_symbol\n"  # species.chemical_symbols
         "  _atom_site_label\n"  # species.name + unique int
@@ -118,34 +168,41 @@ def get_cif(  # pylint: disable=too-many-locals,too-many-branches
     )
 
     if coord_type == "fract":
-        sites = attributes.fractional_site_positions
+        sites = np.asarray(attributes.fractional_site_positions, dtype=np.float64)
     else:
-        sites = attributes.cartesian_site_positions
-
-    species: Dict[str, OptimadeStructureSpecies] = {
-        species.name: species for species in attributes.species
+        sites = np.asarray(attributes.cartesian_site_positions, dtype=np.float64)
+
+    # Pre-format all coordinates with a single vectorized call,
+    # instead of three %-conversions per row in the site loop below
+    sites = np.char.mod("%8.5f", sites)
+
+    # Pre-filter vacancies and resolve the chemical symbols and concentrations
+    # once per species rather than once per site; the labels cannot be precomputed
+    # here since they number each symbol consecutively across all sites
+    species_rows: Dict[str, List[Tuple[str, float]]] = {
+        current_species.name: [
+            (symbol, current_species.concentration[index])
+            for index, symbol in enumerate(current_species.chemical_symbols)
+            if symbol != "vacancy"
+        ]
+        for current_species in attributes.species
     }
 
-    symbol_occurences = {}
-    for site_number in range(attributes.nsites):
-        species_name = attributes.species_at_sites[site_number]
-        site = sites[site_number]
+    # Align the pre-resolved rows with the sites they occupy
+    rows_per_site = [species_rows[name] for name in attributes.species_at_sites]
 
-        current_species = species[species_name]
-
-        for index, symbol in enumerate(current_species.chemical_symbols):
-            if symbol == "vacancy":
-                continue
+    symbol_occurences: Dict[str, int] = {}
+    for site_number, site_rows in enumerate(rows_per_site):
+        site = sites[site_number]
 
-            if symbol in symbol_occurences:
-                symbol_occurences[symbol] += 1
-            else:
-                symbol_occurences[symbol] = 1
-            label = f"{symbol}{symbol_occurences[symbol]}"
+        for symbol, concentration in site_rows:
+            occurrence = symbol_occurences.get(symbol, 0) + 1
+            symbol_occurences[symbol] = occurrence
+            label = f"{symbol}{occurrence}"
 
-            cif += (
-                f"  {symbol} {label} {current_species.concentration[index]:6.4f} {site[0]:8.5f}  "
-                f"{site[1]:8.5f}  {site[2]:8.5f}  {'Biso':4}  {'1.000':6}\n"
+            cif.append(
+                _ATOM_SITE_ROW_FMT
+                % (symbol, label, concentration, site[0], site[1], site[2])
             )
 
     return cif
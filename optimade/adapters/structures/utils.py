@@ -5,6 +5,7 @@ Most of these functions rely on the [NumPy](https://numpy.org/) library.
 """
 from typing import List, Tuple, Iterable
 
+from optimade.models.structures import Species as OptimadeStructureSpecies
 from optimade.models.structures import Vector3D
 
 try:
@@ -79,9 +80,8 @@ def fractional_coordinates(
     # See `ase.atoms:Atoms.get_scaled_positions()` for ideas on how to handle lower dimensional structures.
     # Furthermore, according to ASE we need to modulo 1.0 twice.
     # This seems to be due to small floats % 1.0 becomes 1.0, hence twice makes it 0.0.
-    for i in range(3):
-        fractional[:, i] %= 1.0
-        fractional[:, i] %= 1.0
+    fractional %= 1.0
+    fractional %= 1.0
 
     return [tuple(position) for position in fractional]
 
@@ -111,21 +111,24 @@ def cell_to_cellpar(
 
     cell = np.asarray(cell)
 
-    lengths = [np.linalg.norm(vector) for vector in cell]
-    angles = []
-    for i in range(3):
-        j = i - 1
-        k = i - 2
-        outer_product = lengths[j] * lengths[k]
-        if outer_product > 1e-16:
-            x_vector = np.dot(cell[j], cell[k]) / outer_product
-            angle = 180.0 / np.pi * np.arccos(x_vector)
-        else:
-            angle = 90.0
-        angles.append(angle)
+    lengths = np.linalg.norm(cell, axis=1)
+
+    # Calculate all three angles at once:
+    # alpha is the angle between b and c, beta between c and a and gamma between a and b
+    first_vectors = cell[[2, 0, 1]]
+    second_vectors = cell[[1, 2, 0]]
+    outer_products = lengths[[2, 0, 1]] * lengths[[1, 2, 0]]
+
+    angles = np.full(3, 90.0)
+    valid = outer_products > 1e-16
+    x_vectors = (
+        np.einsum("ij,ij->i", first_vectors[valid], second_vectors[valid])
+        / outer_products[valid]
+    )
+    angles[valid] = 180.0 / np.pi * np.arccos(x_vectors)
     if radians:
-        angles = [angle * np.pi / 180 for angle in angles]
-    return np.array(lengths + angles)
+        angles *= np.pi / 180
+    return np.concatenate((lengths, angles))
 
 
 def unit_vector(x: Vector3D) -> Vector3D:
@@ -291,6 +294,29 @@ def _pad_iter_of_iters(
     return iterable, padded_iterable
 
 
+def species_from_species_at_sites(
+    species_at_sites: List[str], species: List[OptimadeStructureSpecies]
+) -> List[OptimadeStructureSpecies]:
+    """Align the species with the sites they occupy.
+
+    Doing the name resolution once up front turns the per-site species access
+    in the conversion functions into a plain list index.
+
+    Parameters:
+        species_at_sites: A list of species names, one per site. This equates to the
+            [`species_at_sites`][optimade.models.structures.StructureResourceAttributes.species_at_sites]
+            attribute.
+        species: A list of species. This equates to the
+            [`species`][optimade.models.structures.StructureResourceAttributes.species] attribute.
+
+    Returns:
+        A list of species aligned with `species_at_sites`, i.e., one species per site.
+
+    """
+    keyed_species = {_.name: _ for _ in species}
+    return [keyed_species[name] for name in species_at_sites]
+
+
 def pad_cell(
     lattice_vectors: Tuple[Vector3D, Vector3D, Vector3D], padding: float = None
 ) -> Tuple[Tuple[Vector3D, Vector3D, Vector3D], bool]:
@@ -6,6 +6,10 @@ __all__ = ("AdapterPackageNotFound", "ConversionWarning")
 class AdapterPackageNotFound(OptimadeWarning):
     """The package for an adapter cannot be found."""
 
+    __slots__ = ()
+
 
 class ConversionWarning(OptimadeWarning):
     """A non-critical error/fallback/choice happened during conversion of an entry to format."""
+
+    __slots__ = ()
@@ -83,6 +83,10 @@ class MongoCollection(EntryCollection):
     def insert(self, data: List[EntryResource]) -> None:
         """Add the given entries to the underlying database.
 
+        The entries are inserted in unordered batches so the driver does not
+        have to hold (and serialize) the entire list in a single bulk operation,
+        nor enforce server-side ordering between documents.
+
         Warning:
             No validation is performed on the incoming data.
 
@@ -90,7 +94,11 @@ class MongoCollection(EntryCollection):
             data: The entry resource objects to add to the database.
 
         """
-        self.collection.insert_many(data)
+        batch_size = 1000
+        for batch_start in range(0, len(data), batch_size):
+            self.collection.insert_many(
+                data[batch_start : batch_start + batch_size], ordered=False
+            )
 
     def _run_db_query(
         self, criteria: Dict[str, Any], single_entry: bool = False
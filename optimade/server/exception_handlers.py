@@ -35,19 +35,20 @@ def general_exception(
         A JSON HTTP response based on [`ErrorResponse`][optimade.models.responses.ErrorResponse].
 
     """
-    debug_info = {}
-    if CONFIG.debug:
-        tb = "".join(
-            traceback.format_exception(etype=type(exc), value=exc, tb=exc.__traceback__)
-        )
-        LOGGER.error("Traceback:\n%s", tb)
-        debug_info[f"_{CONFIG.provider.prefix}_traceback"] = tb
-
     try:
         http_response_code = int(exc.status_code)
     except AttributeError:
         http_response_code = int(status_code)
 
+    # Formatting a traceback walks the stack in pure Python, so only do it for
+    # debug mode or genuine server errors, not for routine 4xx responses.
+    debug_info = {}
+    if CONFIG.debug or http_response_code >= 500:
+        tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        LOGGER.error("Traceback:\n%s", tb)
+        if CONFIG.debug:
+            debug_info[f"_{CONFIG.provider.prefix}_traceback"] = tb
+
     try:
         title = str(exc.title)
     except AttributeError:
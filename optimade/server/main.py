@@ -61,7 +61,6 @@ This specification is generated using [`optimade-python-tools`](https://github.c
 
 
 if CONFIG.insert_test_data:
-    import bson.json_util
     from bson.objectid import ObjectId
     import optimade.server.data as data
     from optimade.server.routers import ENTRY_COLLECTIONS
@@ -80,9 +79,12 @@ if CONFIG.insert_test_data:
             )
             providers = get_providers()
             for doc in providers:
+                # The only extended-JSON value in a provider document is its `$oid`,
+                # so it can be coerced directly without a bson serialization round-trip
+                object_id = ObjectId(doc["_id"]["$oid"])
                 endpoint_collection.collection.replace_one(
-                    filter={"_id": ObjectId(doc["_id"]["$oid"])},
-                    replacement=bson.json_util.loads(bson.json_util.dumps(doc)),
+                    filter={"_id": object_id},
+                    replacement={**doc, "_id": object_id},
                     upsert=True,
                 )
         LOGGER.debug("Done inserting test %s!", endpoint_name)
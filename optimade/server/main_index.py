@@ -54,7 +54,6 @@ This specification is generated using [`optimade-python-tools`](https://github.c
 
 
 if CONFIG.insert_test_data and CONFIG.index_links_path.exists():
-    import bson.json_util
     from bson.objectid import ObjectId
     from optimade.server.routers.links import links_coll
     from optimade.server.routers.utils import mongo_id_for_database, get_providers
@@ -65,14 +64,14 @@ if CONFIG.insert_test_data and CONFIG.index_links_path.exists():
 
     processed = []
     for db in data:
-        db["_id"] = {"$oid": mongo_id_for_database(db["id"], db["type"])}
+        db["_id"] = ObjectId(mongo_id_for_database(db["id"], db["type"]))
         processed.append(db)
 
     LOGGER.debug(
         "Inserting index links into collection from %s...", CONFIG.index_links_path
     )
 
-    links_coll.insert(bson.json_util.loads(bson.json_util.dumps(processed)))
+    links_coll.insert(processed)
 
     if CONFIG.database_backend.value in ("mongodb", "mongomock"):
         LOGGER.debug(
@@ -80,9 +79,12 @@ if CONFIG.insert_test_data and CONFIG.index_links_path.exists():
         )
         providers = get_providers()
         for doc in providers:
+            # The only extended-JSON value in a provider document is its `$oid`,
+            # so it can be coerced directly without a bson serialization round-trip
+            object_id = ObjectId(doc["_id"]["$oid"])
             links_coll.collection.replace_one(
-                filter={"_id": ObjectId(doc["_id"]["$oid"])},
-                replacement=bson.json_util.loads(bson.json_util.dumps(doc)),
+                filter={"_id": object_id},
+                replacement={**doc, "_id": object_id},
                 upsert=True,
             )
 
@@ -1,7 +1,20 @@
-from typing import Tuple, Optional, Type, Set, Dict, Any, Union, List, Iterable
+from typing import (
+    Tuple,
+    Optional,
+    Type,
+    Set,
+    FrozenSet,
+    Dict,
+    Any,
+    Union,
+    List,
+    Iterable,
+)
+from functools import lru_cache
 import warnings
 
 from optimade.models.entries import EntryResource
+from optimade.server.schemas import retrieve_queryable_properties
 
 __all__ = ("BaseResourceMapper",)
 
@@ -61,45 +74,61 @@ class BaseResourceMapper:
     except (ImportError, ModuleNotFoundError):
         PROVIDERS = {}
 
-    KNOWN_PROVIDER_PREFIXES: Set[str] = set(
+    KNOWN_PROVIDER_PREFIXES: FrozenSet[str] = frozenset(
         prov["id"] for prov in PROVIDERS.get("data", [])
     )
     ALIASES: Tuple[Tuple[str, str]] = ()
     LENGTH_ALIASES: Tuple[Tuple[str, str]] = ()
     PROVIDER_FIELDS: Tuple[str] = ()
     ENTRY_RESOURCE_CLASS: Type[EntryResource] = EntryResource
-    RELATIONSHIP_ENTRY_TYPES: Set[str] = {"references", "structures"}
-    TOP_LEVEL_NON_ATTRIBUTES_FIELDS: Set[str] = {"id", "type", "relationships", "links"}
+    RELATIONSHIP_ENTRY_TYPES: FrozenSet[str] = frozenset({"references", "structures"})
+    TOP_LEVEL_NON_ATTRIBUTES_FIELDS: FrozenSet[str] = frozenset(
+        {"id", "type", "relationships", "links"}
+    )
     SUPPORTED_PREFIXES: Set[str]
     ALL_ATTRIBUTES: Set[str]
     ENTRY_RESOURCE_ATTRIBUTES: Dict[str, Any]
     ENDPOINT: str
 
+    _alias_for_warned: bool = False
+    _alias_of_warned: bool = False
+
+    def __init_subclass__(cls) -> None:
+        """Precompute the schema-derived class constants when a mapper
+        subclass is created, i.e., at import time rather than inside the
+        first request that touches them.
+
+        The plain class attributes assigned here shadow the inherited lazy
+        `classproperty` descriptors, so later access is a straight attribute
+        lookup that no longer traverses `ENTRY_RESOURCE_CLASS.schema()`.
+        The config-dependent properties (`SUPPORTED_PREFIXES`,
+        `ALL_ATTRIBUTES`) are deliberately left lazy, as creating a mapper
+        subclass must not load the server config.
+
+        """
+        super().__init_subclass__()
+        for attribute in ("ENDPOINT", "ENTRY_RESOURCE_ATTRIBUTES"):
+            if attribute not in cls.__dict__:
+                setattr(cls, attribute, getattr(cls, attribute))
+
     @classmethod
+    @lru_cache(maxsize=None)
     def all_aliases(cls) -> Tuple[Tuple[str, str]]:
         """Returns all of the associated aliases for this entry type,
         including those defined by the server config. The first member
         of each tuple is the OPTIMADE-compliant field name, the second
         is the backend-specific field name.
 
+        The pairs are derived from the canonical dict form held by
+        [`_alias_map()`][optimade.server.mappers.entries.BaseResourceMapper._alias_map]
+        and cached on first access, as the aliases are invariant once the
+        server config has been loaded.
+
         Returns:
             A tuple of alias tuples.
 
         """
-        from optimade.server.config import CONFIG
-
-        return (
-            tuple(
-                (f"_{CONFIG.provider.prefix}_{field}", field)
-                for field in CONFIG.provider_fields.get(cls.ENDPOINT, [])
-            )
-            + tuple(
-                (f"_{CONFIG.provider.prefix}_{field}", field)
-                for field in cls.PROVIDER_FIELDS
-            )
-            + tuple(CONFIG.aliases.get(cls.ENDPOINT, {}).items())
-            + cls.ALIASES
-        )
+        return tuple(cls._alias_map().items())
 
     @classproperty
     def SUPPORTED_PREFIXES(cls) -> Set[str]:
@@ -111,6 +140,20 @@ class BaseResourceMapper:
             namespaces (for serving fields from, e.g., other providers or
             domain-specific terms).
 
+        """
+        return cls._supported_prefixes()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _supported_prefixes(cls) -> Set[str]:
+        """Cached value underlying
+        [`SUPPORTED_PREFIXES`][optimade.server.mappers.entries.BaseResourceMapper.SUPPORTED_PREFIXES].
+
+        These properties remain lazy `classproperty` descriptors (unlike the
+        schema-derived constants warmed in `__init_subclass__`) as they must
+        not load the server config at import time, but the computed value
+        itself is invariant and can be cached per mapper class.
+
         """
         from optimade.server.config import CONFIG
 
@@ -119,6 +162,15 @@ class BaseResourceMapper:
     @classproperty
     def ALL_ATTRIBUTES(cls) -> Set[str]:
         """Returns all attributes served by this entry."""
+        return cls._all_attributes()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _all_attributes(cls) -> Set[str]:
+        """Cached value underlying
+        [`ALL_ATTRIBUTES`][optimade.server.mappers.entries.BaseResourceMapper.ALL_ATTRIBUTES].
+
+        """
         from optimade.server.config import CONFIG
 
         return (
@@ -133,8 +185,6 @@ class BaseResourceMapper:
     @classproperty
     def ENTRY_RESOURCE_ATTRIBUTES(cls) -> Dict[str, Any]:
         """Returns the dictionary of attributes defined by the underlying entry resource class."""
-        from optimade.server.schemas import retrieve_queryable_properties
-
         return retrieve_queryable_properties(cls.ENTRY_RESOURCE_CLASS.schema())
 
     @classproperty
@@ -151,10 +201,14 @@ class BaseResourceMapper:
         )
 
     @classmethod
+    @lru_cache(maxsize=None)
     def all_length_aliases(cls) -> Tuple[Tuple[str, str]]:
         """Returns all of the associated length aliases for this class,
         including those defined by the server config.
 
+        The result is cached on first access, like
+        [`all_aliases()`][optimade.server.mappers.entries.BaseResourceMapper.all_aliases].
+
         Returns:
             A tuple of length alias tuples.
 
@@ -165,6 +219,76 @@ class BaseResourceMapper:
             CONFIG.length_aliases.get(cls.ENDPOINT, {}).items()
         )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _length_alias_map(cls) -> Dict[str, str]:
+        """Returns the length aliases from
+        [`all_length_aliases()`][optimade.server.mappers.entries.BaseResourceMapper.all_length_aliases]
+        as a dict, keyed by the OPTIMADE field name, cached per mapper class.
+
+        """
+        return dict(cls.all_length_aliases())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _alias_map(cls) -> Dict[str, str]:
+        """Returns the canonical dict of aliases for this entry type, keyed
+        by the OPTIMADE field name, cached per mapper class.
+
+        This is the single source the other alias accessors derive from;
+        when the same OPTIMADE field is aliased by several sources, the
+        class-level `ALIASES` take precedence over the server config.
+
+        """
+        from optimade.server.config import CONFIG
+
+        prefix = CONFIG.provider.prefix
+
+        aliases = {
+            f"_{prefix}_{field}": field
+            for field in CONFIG.provider_fields.get(cls.ENDPOINT, [])
+        }
+        aliases.update((f"_{prefix}_{field}", field) for field in cls.PROVIDER_FIELDS)
+        aliases.update(CONFIG.aliases.get(cls.ENDPOINT, {}))
+        aliases.update(cls.ALIASES)
+
+        return aliases
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _inverse_alias_map(cls) -> Dict[str, str]:
+        """Returns the aliases from
+        [`_alias_map()`][optimade.server.mappers.entries.BaseResourceMapper._alias_map]
+        as a dict, keyed by the backend field name, cached per mapper class.
+
+        When several OPTIMADE fields alias the same backend field, only the
+        last of them is kept, matching
+        [`get_optimade_field()`][optimade.server.mappers.entries.BaseResourceMapper.get_optimade_field];
+        use
+        [`_inverse_alias_multimap()`][optimade.server.mappers.entries.BaseResourceMapper._inverse_alias_multimap]
+        where every alias is needed.
+
+        """
+        return {real: alias for alias, real in cls._alias_map().items()}
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _inverse_alias_multimap(cls) -> Dict[str, Tuple[str, ...]]:
+        """Returns *all* OPTIMADE aliases of each backend field as a dict of
+        tuples, keyed by the backend field name, cached per mapper class.
+
+        A single backend field may serve several OPTIMADE fields (e.g., one
+        database field aliased by both `chemical_formula_descriptive` and
+        `chemical_formula_reduced`), in which case
+        [`map_back()`][optimade.server.mappers.entries.BaseResourceMapper.map_back]
+        must fan its value out to each of them.
+
+        """
+        multimap: Dict[str, List[str]] = {}
+        for alias, real in cls._alias_map().items():
+            multimap.setdefault(real, []).append(alias)
+        return {real: tuple(aliases) for real, aliases in multimap.items()}
+
     @classmethod
     def length_alias_for(cls, field: str) -> Optional[str]:
         """Returns the length alias for the particular field,
@@ -177,9 +301,10 @@ class BaseResourceMapper:
             Aliased field as found in [`all_length_aliases()`][optimade.server.mappers.entries.BaseResourceMapper.all_length_aliases].
 
         """
-        return dict(cls.all_length_aliases()).get(field, None)
+        return cls._length_alias_map().get(field, None)
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def get_backend_field(cls, optimade_field: str) -> str:
         """Return the field name configured for the particular
         underlying database for the passed OPTIMADE field name, that would
@@ -192,6 +317,8 @@ class BaseResourceMapper:
         This means for an (OPTIMADE, DB) alias of (`species`, `kinds`), `get_backend_fields("species.mass")`
         will return `kinds.mass`.
 
+        The result is memoized per mapper class and field name.
+
         Arguments:
             optimade_field: The OPTIMADE field to attempt to map to the backend-specific field.
 
@@ -207,11 +334,11 @@ class BaseResourceMapper:
             The mapped field name to be used in the query to the backend.
 
         """
-        split = optimade_field.split(".")
-        alias = dict(cls.all_aliases()).get(split[0], None)
-        if alias is not None:
-            return alias + ("." + ".".join(split[1:]) if len(split) > 1 else "")
-        return optimade_field
+        field, dot, nested_field = optimade_field.partition(".")
+        alias = cls._alias_map().get(field, None)
+        if alias is None:
+            return optimade_field
+        return f"{alias}.{nested_field}" if dot else alias
 
     @classmethod
     def alias_for(cls, field: str) -> str:
@@ -228,13 +355,17 @@ class BaseResourceMapper:
             Aliased field as found in [`all_aliases()`][optimade.server.mappers.entries.BaseResourceMapper.all_aliases].
 
         """
-        warnings.warn(
-            "The `.alias_for(...)` method is deprecated, please use `.get_backend_field(...)`.",
-            DeprecationWarning,
-        )
+        if not cls._alias_for_warned:
+            warnings.warn(
+                "The `.alias_for(...)` method is deprecated, please use `.get_backend_field(...)`.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            cls._alias_for_warned = True
         return cls.get_backend_field(field)
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def get_optimade_field(cls, backend_field: str) -> str:
         """Return the corresponding OPTIMADE field name for the underlying database field,
         ready to be used to construct the OPTIMADE-compliant JSON response.
@@ -242,6 +373,8 @@ class BaseResourceMapper:
         Aliases are read from
         [`all_aliases()`][optimade.server.mappers.entries.BaseResourceMapper.all_aliases].
 
+        The result is memoized per mapper class and field name.
+
         Arguments:
             backend_field: The backend field to attempt to map to an OPTIMADE field.
 
@@ -257,9 +390,7 @@ class BaseResourceMapper:
             The mapped field name to be used in an OPTIMADE-compliant response.
 
         """
-        return {alias: real for real, alias in cls.all_aliases()}.get(
-            backend_field, backend_field
-        )
+        return cls._inverse_alias_map().get(backend_field, backend_field)
 
     @classmethod
     def alias_of(cls, field: str) -> str:
@@ -277,10 +408,13 @@ class BaseResourceMapper:
             De-aliased field name, falling back to returning `field`.
 
         """
-        warnings.warn(
-            "The `.alias_of(...)` method is deprecated, please use `.get_optimade_field(...)`.",
-            DeprecationWarning,
-        )
+        if not cls._alias_of_warned:
+            warnings.warn(
+                "The `.alias_of(...)` method is deprecated, please use `.get_optimade_field(...)`.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            cls._alias_of_warned = True
         return cls.get_optimade_field(field)
 
     @classmethod
@@ -310,27 +444,18 @@ class BaseResourceMapper:
             A resource object in OPTIMADE format.
 
         """
-        mapping = ((real, alias) for alias, real in cls.all_aliases())
+        real_to_aliases = cls._inverse_alias_multimap()
+        top_level_fields = cls.TOP_LEVEL_NON_ATTRIBUTES_FIELDS
+
         newdoc = {}
-        reals = {real for alias, real in cls.all_aliases()}
-        for key in doc:
-            if key not in reals:
-                newdoc[key] = doc[key]
-        for real, alias in mapping:
-            if real in doc:
-                newdoc[alias] = doc[real]
-
-        if "attributes" in newdoc:
-            raise Exception("Will overwrite doc field!")
-        attributes = newdoc.copy()
-
-        for field in cls.TOP_LEVEL_NON_ATTRIBUTES_FIELDS:
-            value = attributes.pop(field, None)
-            if value is not None:
-                newdoc[field] = value
-        for field in list(newdoc.keys()):
-            if field not in cls.TOP_LEVEL_NON_ATTRIBUTES_FIELDS:
-                del newdoc[field]
+        attributes = {}
+        for real, value in doc.items():
+            for field in real_to_aliases.get(real, (real,)):
+                if field in top_level_fields:
+                    if value is not None:
+                        newdoc[field] = value
+                else:
+                    attributes[field] = value
 
         newdoc["type"] = cls.ENDPOINT
         newdoc["attributes"] = attributes
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
 from fastapi import APIRouter, Request
 from fastapi.exceptions import StarletteHTTPException
 
@@ -14,6 +17,20 @@ from optimade.server.schemas import (
 router = APIRouter(redirect_slashes=True)
 
 
+@lru_cache(maxsize=None)
+def _get_entry_info(entry: str) -> Tuple[dict, Dict[str, Any]]:
+    """Build the schema and queryable properties for an entry type.
+
+    The underlying pydantic schemas are immutable at runtime, so the result is
+    computed only once per entry type instead of on every `/info/{entry}` request.
+
+    """
+    schema = ENTRY_INFO_SCHEMAS[entry]()
+    queryable_properties = {"id", "type", "attributes"}
+    properties = retrieve_queryable_properties(schema, queryable_properties)
+    return schema, properties
+
+
 @router.get(
     "/info",
     response_model=InfoResponse,
@@ -63,9 +80,7 @@ def get_entry_info(request: Request, entry: str) -> EntryInfoResponse:
             detail=f"Entry info not found for {entry}, valid entry info endpoints are: {', '.join(valid_entry_info_endpoints)}",
         )
 
-    schema = ENTRY_INFO_SCHEMAS[entry]()
-    queryable_properties = {"id", "type", "attributes"}
-    properties = retrieve_queryable_properties(schema, queryable_properties)
+    schema, properties = _get_entry_info(entry)
 
     output_fields_by_format = {"json": list(properties.keys())}
 
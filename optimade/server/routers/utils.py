@@ -11,6 +11,7 @@ from starlette.datastructures import URL as StarletteURL
 from optimade import __api_version__
 from optimade.models import (
     ResponseMeta,
+    ResponseMetaQuery,
     EntryResource,
     EntryResponseMany,
     EntryResponseOne,
@@ -48,8 +49,6 @@ def meta_values(
     **kwargs,
 ) -> ResponseMeta:
     """Helper to initialize the meta values"""
-    from optimade.models import ResponseMetaQuery
-
     if isinstance(url, str):
         url = urllib.parse.urlparse(url)
 
@@ -235,10 +234,12 @@ def get_entries(
     included = get_included_relationships(results, ENTRY_COLLECTIONS, include)
 
     if more_data_available:
-        # Deduce the `next` link from the current request
-        query = urllib.parse.parse_qs(request.url.query)
-        query["page_offset"] = int(query.get("page_offset", [0])[0]) + len(results)
-        urlencoded = urllib.parse.urlencode(query, doseq=True)
+        # Deduce the `next` link from the current request.
+        # Starlette has already parsed the query string once, so reuse its
+        # query params instead of running parse_qs on the raw URL again.
+        query = dict(request.query_params)
+        query["page_offset"] = int(query.get("page_offset", 0)) + len(results)
+        urlencoded = urllib.parse.urlencode(query)
         base_url = get_base_url(request.url)
 
         links = ToplevelLinks(next=f"{base_url}{request.url.path}?{urlencoded}")
@@ -37,17 +37,34 @@ def retrieve_queryable_properties(
     properties = {}
     for name, value in schema["properties"].items():
         if not queryable_properties or name in queryable_properties:
+            if "allOf" in value:
+                # `allOf` is how pydantic wraps a reference to another model
+                # when the field carries extra keys (e.g. a description).
+                # Resolve it into a direct `$ref` on a copy, so the model's
+                # cached schema is not mutated.
+                value = {key: _ for key, _ in value.items() if key != "allOf"}
+                for reference in schema["properties"][name]["allOf"]:
+                    value.update(reference)
+            sub_schema = None
             if "$ref" in value:
                 path = value["$ref"].split("/")[1:]
                 sub_schema = schema.copy()
                 while path:
                     next_key = path.pop(0)
                     sub_schema = sub_schema[next_key]
+            if sub_schema is not None and "properties" in sub_schema:
                 sub_queryable_properties = sub_schema["properties"].keys()
+                # Thread the root schema's definitions along, since the
+                # sub-schema's own `$ref`s can only be resolved against them.
                 properties.update(
-                    retrieve_queryable_properties(sub_schema, sub_queryable_properties)
+                    retrieve_queryable_properties(
+                        {**sub_schema, "definitions": schema.get("definitions", {})},
+                        sub_queryable_properties,
+                    )
                 )
             else:
+                # References without `properties` (e.g. enum definitions) are
+                # scalar fields and are described by the field itself.
                 properties[name] = {"description": value.get("description", "")}
                 # Update schema with extension keys provided they are not None
                 for key in [_ for _ in ("unit", "queryable", "support") if _ in value]:
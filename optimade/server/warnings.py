@@ -1,6 +1,8 @@
 class OptimadeWarning(Warning):
     """Base Warning for the `optimade` package"""
 
+    __slots__ = ("detail", "title")
+
     def __init__(self, detail: str = None, title: str = None, *args) -> None:
         detail = detail if detail else self.__doc__
         super().__init__(detail, *args)
@@ -8,20 +10,12 @@ class OptimadeWarning(Warning):
         self.title = title if title else self.__class__.__name__
 
     def __repr__(self) -> str:
-        attrs = {
-            "detail": self.detail,
-            "title": self.title,
-        }
-        return "<{:s}({:s})>".format(
-            self.__class__.__name__,
-            " ".join(
-                [
-                    f"{attr}={value!r}"
-                    for attr, value in attrs.items()
-                    if value is not None
-                ]
-            ),
-        )
+        parts = []
+        if self.detail is not None:
+            parts.append(f"detail={self.detail!r}")
+        if self.title is not None:
+            parts.append(f"title={self.title!r}")
+        return f"<{self.__class__.__name__}({' '.join(parts)})>"
 
     def __str__(self) -> str:
         return self.detail if self.detail is not None else ""
@@ -30,19 +24,27 @@ class OptimadeWarning(Warning):
 class FieldValueNotRecognized(OptimadeWarning):
     """A field or value used in the request is not recognised by this implementation."""
 
+    __slots__ = ()
+
 
 class TooManyValues(OptimadeWarning):
     """A field or query parameter has too many values to be handled by this implementation."""
 
+    __slots__ = ()
+
 
 class QueryParamNotUsed(OptimadeWarning):
     """A query parameter is not used in this request."""
 
+    __slots__ = ()
+
 
 class MissingExpectedField(OptimadeWarning):
     """A field was provided with a null value when a related field was provided
     with a value."""
 
+    __slots__ = ()
+
 
 class TimestampNotRFCCompliant(OptimadeWarning):
     """A timestamp has been used in a filter that contains microseconds and is thus not
@@ -50,9 +52,13 @@ class TimestampNotRFCCompliant(OptimadeWarning):
 
     """
 
+    __slots__ = ()
+
 
 class UnknownProviderProperty(OptimadeWarning):
     """A provider-specific property has been requested via `response_fields` or as in a `filter` that is not
     recognised by this implementation.
 
     """
+
+    __slots__ = ()
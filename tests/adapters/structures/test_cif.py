@@ -13,7 +13,7 @@ numpy = pytest.importorskip(
 )
 
 from optimade.adapters import Structure
-from optimade.adapters.structures.cif import get_cif
+from optimade.adapters.structures.cif import get_cif, get_cif_bytes
 
 
 def test_successful_conversion(RAW_STRUCTURES):
@@ -27,6 +27,14 @@ def test_null_lattice_vectors(null_lattice_vector_structure):
     assert isinstance(get_cif(null_lattice_vector_structure), str)
 
 
+def test_get_cif_bytes(RAW_STRUCTURES):
+    """Make sure the bytes output matches the encoded str output"""
+    for structure in RAW_STRUCTURES:
+        structure = Structure(structure)
+
+        assert get_cif_bytes(structure) == get_cif(structure).encode("latin-1")
+
+
 def test_special_species(SPECIAL_SPECIES_STRUCTURES):
     """Make sure vacancies and non-chemical symbols ("X") are handled"""
     for special_structure in SPECIAL_SPECIES_STRUCTURES:
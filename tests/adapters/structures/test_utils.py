@@ -16,12 +16,27 @@ from optimade.adapters.structures.utils import (
     fractional_coordinates,
     pad_cell,
     scaled_cell,
+    species_from_species_at_sites,
 )
 
 
 # TODO: Add tests for cell_to_cellpar, unit_vector, cellpar_to_cell
 
 
+def test_species_from_species_at_sites(structure):
+    """Make sure the species are resolved by name and aligned with the sites"""
+    species_at_sites = structure.attributes.species_at_sites
+
+    species_per_site = species_from_species_at_sites(
+        species_at_sites, structure.attributes.species
+    )
+
+    assert len(species_per_site) == len(species_at_sites)
+    assert [
+        current_species.name for current_species in species_per_site
+    ] == species_at_sites
+
+
 def test_pad_cell(null_lattice_vector_structure):
     """Make sure None values in lattice_vectors are converted to padding float value"""
     lattice_vectors, padded_cell = pad_cell(